@@ -7,6 +7,10 @@ on each of the long sides, with notches that are 20% of the width deep.
 
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple
+
+import numpy as np
 
 # Add the parent directory to the Python path so we can import dxf_library
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -14,7 +18,7 @@ sys.path.append(parent_dir)
 
 # Try to import our custom library
 try:
-    from dxf_library import DxfDrawing, Rectangle
+    from dxf_library import DxfDrawing
     print(f"Successfully imported dxf_library from: {parent_dir}")
 except ImportError as e:
     print(f"Error: Could not import dxf_library. {e}")
@@ -22,6 +26,89 @@ except ImportError as e:
     print("Make sure dxf_library.py is in the parent directory.")
     sys.exit(1)
 
+# numba is optional: with it installed the geometry helper below is
+# JIT-compiled once and cached, which matters when the generator is driven
+# interactively (e.g. a slider over the notch depth percentage)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Shared dxfattribs dict for all cut outlines (reused across polylines)
+_CUT_ATTRS = {"layer": "cut_layer"}
+
+
+def _notch_geometry(width: float, notch_depth_pct: float, notch1_x: float,
+                    notch2_x: float, notch_width: float):
+    """
+    Compute the depth-dependent notch layout for a notched rectangle.
+
+    The depth-invariant notch x-positions come from _build_static_plan.
+
+    Returns:
+        A (4, 4) float64 array of notch x/y/width/height rows (bottom pair
+        first, then the top pair) and a (2,) array with the top and bottom
+        reference-line y-coordinates.
+    """
+    notch_depth = width * notch_depth_pct
+    top_notch_y = width - notch_depth
+
+    notches = np.empty((4, 4), dtype=np.float64)
+    for i in range(4):
+        notches[i, 0] = notch1_x if i % 2 == 0 else notch2_x
+        notches[i, 1] = 0.0 if i < 2 else top_notch_y
+        notches[i, 2] = notch_width
+        notches[i, 3] = notch_depth
+
+    reference_ys = np.empty(2, dtype=np.float64)
+    reference_ys[0] = top_notch_y   # Top reference line
+    reference_ys[1] = notch_depth   # Bottom reference line
+    return notches, reference_ys
+
+
+if njit is not None:
+    _notch_geometry = njit(cache=True)(_notch_geometry)
+
+
+def _build_static_plan(length: float = 200.0, width: float = 50.0,
+                       notch_width: float = 30.0) -> dict:
+    """
+    Precompute everything that does not depend on the notch depth.
+
+    A parameter sweep over notch_depth_percentage (like main's 10%/20%/50%
+    variants, or a GUI slider) can build this plan once and reuse it for
+    every depth.
+
+    Args:
+        length: The length of the main rectangle (along x-axis)
+        width: The width of the main rectangle (along y-axis)
+        notch_width: The width of each notch
+
+    Returns:
+        A dict of depth-invariant geometry consumed by _apply_plan
+    """
+    # Calculate positions for better centered drawing
+    start_x = 0
+    start_y = 0
+
+    # Calculate the positions for notches (centered on the long sides)
+    notch_gap = (length - (2 * notch_width)) / 3  # Evenly space the notches
+
+    return {
+        "length": float(length),
+        "width": float(width),
+        "notch_width": float(notch_width),
+        "start_x": start_x,
+        "start_y": start_y,
+        "notch1_x": start_x + notch_gap,
+        "notch2_x": start_x + (2 * notch_gap) + notch_width,
+        "centerline_y": start_y + (width / 2),
+        # Lines extend a bit beyond the rectangle on both sides
+        "line_start_x": start_x - 10,
+        "line_end_x": start_x + length + 10,
+        "text_position": (start_x, start_y + width + 15),
+    }
+
 
 def create_notched_rectangle(
     length: float = 200.0,
@@ -43,149 +130,129 @@ def create_notched_rectangle(
     Returns:
         A DxfDrawing object with the notched rectangle
     """
-    # Create a new drawing with millimeter units
-    drawing = DxfDrawing(output_file, units="mm")
-
-    # Calculate positions for better centered drawing
-    start_x = 0
-    start_y = 0
+    plan = _build_static_plan(length, width, notch_width)
+    return _apply_plan(plan, notch_depth_percentage, output_file)
 
-    # Calculate actual notch depth based on percentage of width
-    notch_depth = width * notch_depth_percentage
 
-    # Calculate the positions for notches (centered on the long sides)
-    notch_gap = (length - (2 * notch_width)) / 3  # Evenly space the notches
+def _apply_plan(plan: dict, notch_depth_percentage: float,
+                output_file: str) -> DxfDrawing:
+    """
+    Build one notch-depth variant from a precomputed static plan.
 
-    # Create main outline rectangle
-    main_rect = Rectangle(start_x, start_y, length, width, layer="cut_layer")
-    main_rect.add_to_drawing(drawing)
-
-    # Create notches on the bottom side (removing material)
-    # First notch
-    notch1_x = start_x + notch_gap
-    notch1_y = start_y
-    notch1 = Rectangle(notch1_x, notch1_y, notch_width, notch_depth, layer="cut_layer")
-    notch1.add_to_drawing(drawing)
-
-    # Second notch
-    notch2_x = start_x + (2 * notch_gap) + notch_width
-    notch2_y = start_y
-    notch2 = Rectangle(notch2_x, notch2_y, notch_width, notch_depth, layer="cut_layer")
-    notch2.add_to_drawing(drawing)
-
-    # Create notches on the top side (removing material)
-    # First notch
-    notch3_x = start_x + notch_gap
-    notch3_y = start_y + width - notch_depth
-    notch3 = Rectangle(notch3_x, notch3_y, notch_width, notch_depth, layer="cut_layer")
-    notch3.add_to_drawing(drawing)
-
-    # Second notch
-    notch4_x = start_x + (2 * notch_gap) + notch_width
-    notch4_y = start_y + width - notch_depth
-    notch4 = Rectangle(notch4_x, notch4_y, notch_width, notch_depth, layer="cut_layer")
-    notch4.add_to_drawing(drawing)
-
-    # Add a line showing the notch depth for visualization (at 20% from top and bottom)
-    drawing.get_or_create_layer("reference_lines", color=4, linetype="DASHED")  # Cyan color
-
-    # Add top reference line at 20% depth
-    top_reference_y = start_y + width - notch_depth
-    drawing.modelspace.add_line(
-        start=(start_x - 10, top_reference_y),
-        end=(start_x + length + 10, top_reference_y),
-        dxfattribs={"layer": "reference_lines"}
-    )
+    Args:
+        plan: Depth-invariant geometry from _build_static_plan
+        notch_depth_percentage: The depth of the notch as a percentage of width
+        output_file: The filename for the output DXF
 
-    # Add bottom reference line at 20% depth
-    bottom_reference_y = start_y + notch_depth
-    drawing.modelspace.add_line(
-        start=(start_x - 10, bottom_reference_y),
-        end=(start_x + length + 10, bottom_reference_y),
-        dxfattribs={"layer": "reference_lines"}
-    )
+    Returns:
+        A DxfDrawing object with the notched rectangle
+    """
+    # Create a new drawing with millimeter units
+    drawing = DxfDrawing(output_file, units="mm")
 
-    # Add a dashed centerline through the middle of the board (for reference)
-    centerline_y = start_y + (width / 2)
-    drawing.get_or_create_layer("centerline", color=6, linetype="DASHED")  # Magenta color
+    length = plan["length"]
+    width = plan["width"]
+    start_x = plan["start_x"]
+    start_y = plan["start_y"]
 
-    drawing.modelspace.add_line(
-        start=(start_x - 10, centerline_y),  # Extend a bit beyond the rectangle
-        end=(start_x + length + 10, centerline_y),
-        dxfattribs={"layer": "centerline"}
+    # Compute the depth-dependent notch layout in the JIT-compiled helper
+    notches, reference_ys = _notch_geometry(
+        width, float(notch_depth_percentage),
+        plan["notch1_x"], plan["notch2_x"], plan["notch_width"]
     )
 
-    # Add labels to make the drawing clearer
-    drawing.get_or_create_layer("label", color=3)  # Green color
+    # Build all rectangles (main outline plus the four notches) as one
+    # (N, 4) array of x/y/width/height rows, derive the corner points by
+    # broadcasting, and emit the LWPolylines in a single pass.
+    boxes = np.vstack([
+        [[start_x, start_y, length, width]],              # Main outline
+        notches + [0.0, start_y, 0.0, 0.0],               # The four notches
+    ])                                                    # (x includes start_x already)
+
+    origins = boxes[:, :2]
+    sizes = boxes[:, 2:]
+    corners = np.stack([
+        origins,                        # Bottom-left
+        origins + sizes * [1, 0],       # Bottom-right
+        origins + sizes,                # Top-right
+        origins + sizes * [0, 1],       # Top-left
+    ], axis=1)
+
+    for row in corners.tolist():
+        drawing.modelspace.add_lwpolyline(row, dxfattribs=_CUT_ATTRS, close=True)
+
+    # Create the annotation layers in one call
+    drawing.bulk_create_layers([
+        ("reference_lines", 4, "DASHED"),   # Cyan, for notch depth lines
+        ("centerline", 6, "DASHED"),        # Magenta, board centerline
+        ("label", 3, "CONTINUOUS"),         # Green, text labels
+    ])
+
+    # Reference lines at the notch depth (from top and bottom) and the
+    # board centerline
+    top_reference_y = start_y + reference_ys[0]
+    bottom_reference_y = start_y + reference_ys[1]
+    centerline_y = plan["centerline_y"]
+    line_start_x = plan["line_start_x"]
+    line_end_x = plan["line_end_x"]
 
-    # Add text label for the overall drawing
-    text_position = (start_x, start_y + width + 15)
     title_text = f"Notched Rectangle - {int(notch_depth_percentage * 100)}% Depth Joint Example"
-    text_entity = drawing.modelspace.add_text(
-        title_text,
-        dxfattribs={
-            "layer": "label",
-            "height": 5,
-            "insert": text_position,
-            "halign": 0,  # 0 = LEFT alignment
-            "valign": 0   # 0 = BASELINE alignment
-        }
-    )
-
-    # Add percentage labels for the reference lines
     depth_percent_text = f"{int(notch_depth_percentage * 100)}%"
 
-    # Top percentage label
-    drawing.modelspace.add_text(
-        depth_percent_text,
-        dxfattribs={
-            "layer": "label",
-            "height": 3.5,
-            "insert": (start_x + length + 15, top_reference_y),
-            "halign": 0,
-            "valign": 2  # 2 = MIDDLE for vertical alignment
-        }
-    )
-
-    # Bottom percentage label
-    drawing.modelspace.add_text(
-        depth_percent_text,
-        dxfattribs={
-            "layer": "label",
-            "height": 3.5,
-            "insert": (start_x + length + 15, bottom_reference_y),
-            "halign": 0,
-            "valign": 2  # 2 = MIDDLE for vertical alignment
-        }
-    )
+    # Describe all remaining entities up front, then emit them in one pass
+    # through ezdxf's generic entity factory. halign 0 = LEFT; valign
+    # 0 = BASELINE, 2 = MIDDLE.
+    reference_attrs = {"layer": "reference_lines"}
+    pending = [
+        ("LINE", {"start": (line_start_x, top_reference_y),
+                  "end": (line_end_x, top_reference_y), **reference_attrs}),
+        ("LINE", {"start": (line_start_x, bottom_reference_y),
+                  "end": (line_end_x, bottom_reference_y), **reference_attrs}),
+        ("LINE", {"start": (line_start_x, centerline_y),
+                  "end": (line_end_x, centerline_y), "layer": "centerline"}),
+        ("TEXT", {"layer": "label", "height": 5, "text": title_text,
+                  "insert": plan["text_position"],
+                  "halign": 0, "valign": 0}),
+        ("TEXT", {"layer": "label", "height": 3.5, "text": depth_percent_text,
+                  "insert": (line_end_x + 5, top_reference_y),
+                  "halign": 0, "valign": 2}),
+        ("TEXT", {"layer": "label", "height": 3.5, "text": depth_percent_text,
+                  "insert": (line_end_x + 5, bottom_reference_y),
+                  "halign": 0, "valign": 2}),
+    ]
+
+    new_entity = drawing.modelspace.new_entity
+    for dxftype, attrs in pending:
+        new_entity(dxftype, dxfattribs=attrs)
 
     return drawing
 
 
-def main():
-    """Main function to create and save the notched rectangle drawing."""
-    # Create the drawing with 20% notch depth
-    drawing = create_notched_rectangle(notch_depth_percentage=0.2)
-
-    # Save the drawing
-    file_path = drawing.save()
-    print(f"20% notched rectangle drawing saved to: {os.path.abspath(file_path)}")
-
-    # You can also create versions with other percentages
-    shallow_drawing = create_notched_rectangle(
-        notch_depth_percentage=0.1,  # 10% notch depth
-        output_file="notched_rectangle_10percent.dxf"
-    )
-    shallow_drawing.save()
-    print(f"10% notched rectangle drawing saved to: notched_rectangle_10percent.dxf")
+def _render_one(job: Tuple[dict, float, str]) -> str:
+    """Create and save one notch-depth variant (worker for main)."""
+    plan, notch_depth_percentage, output_file = job
+    return _apply_plan(plan, notch_depth_percentage, output_file).save()
 
-    # Create the original 50% version for comparison
-    deep_drawing = create_notched_rectangle(
-        notch_depth_percentage=0.5,  # 50% notch depth (original half-depth design)
-        output_file="notched_rectangle_50percent.dxf"
-    )
-    deep_drawing.save()
-    print(f"50% notched rectangle drawing saved to: notched_rectangle_50percent.dxf")
+
+def main():
+    """Main function to create and save the notched rectangle drawings."""
+    # The depth-invariant geometry is identical across the three variants,
+    # so compute it once and share the plan with every job.
+    plan = _build_static_plan()
+
+    # The three depth variants are independent, and most of the time goes
+    # into ezdxf's CPU-bound DXF serialization, so render them in parallel
+    # worker processes rather than sequentially.
+    jobs = [
+        (plan, 0.1, "notched_rectangle_10percent.dxf"),  # 10% notch depth
+        (plan, 0.2, "notched_rectangle_20percent.dxf"),  # 20% notch depth
+        (plan, 0.5, "notched_rectangle_50percent.dxf"),  # 50% (original half-depth design)
+    ]
+
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        for (_, percentage, _), file_path in zip(jobs, executor.map(_render_one, jobs)):
+            print(f"{int(percentage * 100)}% notched rectangle drawing saved to: "
+                  f"{os.path.abspath(file_path)}")
 
 
 if __name__ == "__main__":